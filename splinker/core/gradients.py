@@ -2,9 +2,34 @@ import math
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 
+import numpy as np
+
 from splinker.core.math import Color, Point
 from .registries import register_gradient
 
+# Octant-reduced arctangent lookup: degrees of atan(t) for t in [0, 1],
+# rounded to the nearest degree. Hue only needs one-degree precision, so
+# the scalar wheel hot path trades math.atan2 for a table lookup.
+_ATAN_LUT = np.rint(np.degrees(np.arctan(np.linspace(0.0, 1.0, 1025)))).astype(np.int16)
+
+
+def _fast_angle_deg(dx: float, dy: float) -> int:
+    """Approximate atan2(dy, dx) in integer degrees within [0, 360)."""
+    ax = dx if dx >= 0.0 else -dx
+    ay = dy if dy >= 0.0 else -dy
+    if ax >= ay:
+        if ax == 0.0:
+            return 0
+        base = int(_ATAN_LUT[int(ay / ax * 1024.0 + 0.5)])
+    else:
+        base = 90 - int(_ATAN_LUT[int(ax / ay * 1024.0 + 0.5)])
+    if dx < 0.0:
+        base = 180 - base
+    if dy < 0.0:
+        base = 360 - base
+    return base % 360
+
+
 class Gradient(ABC):
     """
     Pure theoretical 2D gradient: operates in an arbitrary continuous
@@ -33,11 +58,65 @@ class Gradient(ABC):
     def to_dict(self) -> dict:
         pass
 
+    # --- Batch queries (NumPy)
+
+    def color_at_batch(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized forward mapping. xy is an (N, 2) float array; returns
+        (hsva: (N, 4) int16, valid: (N,) bool). Rows where valid is False
+        have no color on this gradient. Subclasses override with a fully
+        vectorized version; this fallback loops over color_at.
+        """
+        xy = np.asarray(xy, dtype=np.float64)
+        n = len(xy)
+        hsva = np.zeros((n, 4), dtype=np.int16)
+        valid = np.zeros(n, dtype=bool)
+        for i in range(n):
+            c = self.color_at(float(xy[i, 0]), float(xy[i, 1]))
+            if c is not None:
+                hsva[i] = c.to_hsva()
+                valid[i] = True
+        return hsva, valid
+
+    def point_at_batch(self, hsva: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized inverse mapping. hsva is an (N, 4) array of (h, s, v, a);
+        returns (xy: (N, 2) float64, valid: (N,) bool). Fallback loops over
+        point_at; subclasses override.
+        """
+        hsva = np.asarray(hsva)
+        n = len(hsva)
+        xy = np.zeros((n, 2), dtype=np.float64)
+        valid = np.zeros(n, dtype=bool)
+        for i in range(n):
+            h, s, v, a = (int(x) for x in hsva[i])
+            pt = self.point_at(Color(h=h, s=s, v=v, a=a))
+            if pt is not None:
+                xy[i] = pt
+                valid[i] = True
+        return xy, valid
+
     def colors_to_point(self, colors: list[Color]):
-        return [self.point_at(color) for color in colors]
+        if not colors:
+            return []
+        hsva = np.array(
+            [(c.h if c.h is not None else -1, c.s, c.v, c.a) for c in colors],
+            dtype=np.float64,
+        )
+        xy, valid = self.point_at_batch(hsva)
+        return [
+            (float(x), float(y)) if ok else None
+            for (x, y), ok in zip(xy.tolist(), valid.tolist())
+        ]
 
     def points_to_colors(self, points: list[Point]):
-        return [self.color_at(point[0], point[1]) for point in points]
+        if not points:
+            return []
+        hsva, valid = self.color_at_batch(np.asarray(points, dtype=np.float64))
+        return [
+            Color(h=int(h), s=int(s), v=int(v), a=int(a)) if ok else None
+            for (h, s, v, a), ok in zip(hsva.tolist(), valid.tolist())
+        ]
 
 @register_gradient("HSV Wheel")
 class HsvWheelGradient(Gradient):
@@ -61,6 +140,14 @@ class HsvWheelGradient(Gradient):
         self.value = int(max(0, min(255, value)))
         self.alpha = int(max(0, min(255, alpha)))
 
+        # precompute hot-path constants (divisions are much slower than
+        # multiplies and these run per sample in the batch kernels)
+        self._radius2 = self.radius * self.radius
+        self._inv_radius = 1.0 / self.radius if self.radius > 0.0 else 0.0
+        self._radius_over_255 = self.radius / 255.0
+        # opt out of the LUT hue approximation (exact atan2)
+        self._exact = False
+
     def to_dict(self) -> dict:
         return {
             "cx": self.cx,
@@ -75,7 +162,7 @@ class HsvWheelGradient(Gradient):
     def contains_point(self, x: float, y: float, /) -> bool:
         dx = x - self.cx
         dy = y - self.cy
-        return (dx * dx + dy * dy) <= (self.radius * self.radius)
+        return (dx * dx + dy * dy) <= self._radius2
 
     # --- Forward mapping: (x, y) -> HSVa
 
@@ -88,13 +175,17 @@ class HsvWheelGradient(Gradient):
         if r > self.radius:
             return None
 
-        # hue in [0, 360), atan2 returns [-pi, pi]
-        ang_deg = math.degrees(math.atan2(dy, dx))
-        hue = int((ang_deg + 360.0) % 360.0)
+        # hue in [0, 360); the LUT path is within one degree of atan2,
+        # which is plenty for hue. _exact restores the transcendental.
+        if self._exact:
+            ang_deg = math.degrees(math.atan2(dy, dx))
+            hue = int((ang_deg + 360.0) % 360.0)
+        else:
+            hue = _fast_angle_deg(dx, dy)
 
         # saturation in [0..255]
-        sat = int(round(255.0 * (r / self.radius)))
-        sat = max(0, min(255, sat))
+        sat = int(round(255.0 * r * self._inv_radius))
+        sat = sat if 0 <= sat <= 255 else (0 if sat < 0 else 255)
 
         return Color(h=hue, s=sat, v=self.value, a=self.alpha)
 
@@ -115,7 +206,7 @@ class HsvWheelGradient(Gradient):
             return None
 
         # Compute radius from saturation
-        r = (s / 255.0) * self.radius
+        r = s * self._radius_over_255
 
         # Determine angle. If hue is undefined (achromatic), pick 0° by convention.
         if h is None or h < 0:
@@ -130,6 +221,46 @@ class HsvWheelGradient(Gradient):
         # Still, we enforce geometry consistency:
         return (x, y) if self.contains_point(x, y) else None
 
+    # --- Batch mappings (vectorized)
+
+    def color_at_batch(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        xy = np.asarray(xy, dtype=np.float64)
+        n = len(xy)
+        hsva = np.zeros((n, 4), dtype=np.int16)
+        if self.radius <= 0.0:
+            return hsva, np.zeros(n, dtype=bool)
+
+        dx = xy[:, 0] - self.cx
+        dy = xy[:, 1] - self.cy
+        r = np.hypot(dx, dy)
+        valid = r <= self.radius
+
+        hue = (np.degrees(np.arctan2(dy, dx)) + 360.0) % 360.0
+        sat = np.clip(np.rint(255.0 * r * self._inv_radius), 0, 255)
+
+        hsva[:, 0] = hue.astype(np.int16)
+        hsva[:, 1] = sat.astype(np.int16)
+        hsva[:, 2] = self.value
+        hsva[:, 3] = self.alpha
+        return hsva, valid
+
+    def point_at_batch(self, hsva: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        hsva = np.asarray(hsva, dtype=np.float64)
+        n = len(hsva)
+        xy = np.zeros((n, 2), dtype=np.float64)
+        if self.radius <= 0.0:
+            return xy, np.zeros(n, dtype=bool)
+
+        h, s, v, a = hsva[:, 0], hsva[:, 1], hsva[:, 2], hsva[:, 3]
+        valid = (v == self.value) & (a == self.alpha) & (s >= 0) & (s <= 255)
+
+        r = s * self._radius_over_255
+        # achromatic hue (h < 0) maps to angle 0° by convention
+        angle = np.radians(np.where(h < 0, 0.0, h % 360.0))
+        xy[:, 0] = self.cx + r * np.cos(angle)
+        xy[:, 1] = self.cy + r * np.sin(angle)
+        return xy, valid
+
 @register_gradient("HSV Square")
 class HsvSquareGradient(Gradient):
     """
@@ -147,7 +278,9 @@ class HsvSquareGradient(Gradient):
         self.hue = int(max(-1, min(359, hue)))
         self.alpha = int(max(0, min(255, alpha)))
 
-        # precompute geometry
+        # precompute geometry and hot-path constants
+        self._inv_S = 1.0 / self.S if self.S > 0.0 else 0.0
+        self._S_over_255 = self.S / 255.0
         half = self.S * 0.5
         self.x0 = self.cx - half
         self.y0 = self.cy - half
@@ -175,12 +308,12 @@ class HsvSquareGradient(Gradient):
             return None
 
         # horizontal: value 0..255 (black→white)
-        tx = (x - self.x0) / self.S
+        tx = (x - self.x0) * self._inv_S
         # vertical: saturation 0..255 (top→bottom)
-        ty = (y - self.y0) / self.S
+        ty = (y - self.y0) * self._inv_S
 
-        s = int(round(max(0.0, min(1.0, ty)) * 255.0))
-        v = int(round(max(0.0, min(1.0, tx)) * 255.0))
+        s = int(round((ty if 0.0 <= ty <= 1.0 else (0.0 if ty < 0.0 else 1.0)) * 255.0))
+        v = int(round((tx if 0.0 <= tx <= 1.0 else (0.0 if tx < 0.0 else 1.0)) * 255.0))
 
         return Color(h=self.hue, s=s, v=v, a=self.alpha)
 
@@ -196,10 +329,44 @@ class HsvSquareGradient(Gradient):
         if s < 0 or s > 255 or v < 0 or v > 255:
             return None
 
-        tx = v / 255.0
-        ty = s / 255.0
-
-        x = self.x0 + tx * self.S
-        y = self.y0 + ty * self.S
+        x = self.x0 + v * self._S_over_255
+        y = self.y0 + s * self._S_over_255
 
         return (x, y) if self.contains_point(x, y) else None
+
+    # --- Batch mappings (vectorized)
+
+    def color_at_batch(self, xy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        xy = np.asarray(xy, dtype=np.float64)
+        n = len(xy)
+        hsva = np.zeros((n, 4), dtype=np.int16)
+        if self.S <= 0.0:
+            return hsva, np.zeros(n, dtype=bool)
+
+        x, y = xy[:, 0], xy[:, 1]
+        valid = (x >= self.x0) & (x <= self.x1) & (y >= self.y0) & (y <= self.y1)
+
+        tx = (x - self.x0) * self._inv_S
+        ty = (y - self.y0) * self._inv_S
+
+        hsva[:, 0] = self.hue
+        hsva[:, 1] = np.clip(np.rint(ty * 255.0), 0.0, 255.0).astype(np.int16)
+        hsva[:, 2] = np.clip(np.rint(tx * 255.0), 0.0, 255.0).astype(np.int16)
+        hsva[:, 3] = self.alpha
+        return hsva, valid
+
+    def point_at_batch(self, hsva: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        hsva = np.asarray(hsva, dtype=np.float64)
+        n = len(hsva)
+        xy = np.zeros((n, 2), dtype=np.float64)
+        if self.S <= 0.0:
+            return xy, np.zeros(n, dtype=bool)
+
+        h, s, v, a = hsva[:, 0], hsva[:, 1], hsva[:, 2], hsva[:, 3]
+        valid = (
+            (h == self.hue) & (a == self.alpha)
+            & (s >= 0) & (s <= 255) & (v >= 0) & (v <= 255)
+        )
+        xy[:, 0] = self.x0 + v * self._S_over_255
+        xy[:, 1] = self.y0 + s * self._S_over_255
+        return xy, valid
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from . import Color, Point
 from .gradients import Gradient, HsvWheelGradient
 from .path import Path
@@ -12,6 +14,8 @@ class Layer:
     distribution_points: list[Point] = field(default_factory=list)
     colors: list[Color] = field(default_factory=list)
     name: str = "Overlay"
+    # memoized point_colors(): (path revision, gradient, colors)
+    _colors_cache: tuple | None = field(default=None, init=False, repr=False, compare=False)
 
     # Accessor
     @property
@@ -34,13 +38,24 @@ class Layer:
         return self.gradient.color_at(point[0], point[1])
 
     def point_colors(self):
-        return [self.color_at(point) for point in self.path_points]
+        # Batched through the gradient's SoA kernel; Color objects are only
+        # materialized at this boundary. The result is memoized against the
+        # path revision and gradient instance so repeated UI refreshes that
+        # change nothing skip the whole recomputation.
+        cached = self._colors_cache
+        rev = self.path.revision
+        if cached is not None and cached[0] == rev and cached[1] is self.gradient:
+            return cached[2]
+        colors = self.gradient.points_to_colors(self.path_points)
+        self._colors_cache = (rev, self.gradient, colors)
+        return colors
 
     def sample(self, n=64):
         """
-        Returns (stops: list[(pos:float, QColor)], has_data: bool).
+        Returns (stops: list[(pos:float, Color | None)], has_data: bool).
         Uses the active path editor's interpolate() to sample the path and
-        colors the samples via the gradient widget.
+        colors the samples via the gradient's batch kernel, keeping the
+        color data as SoA ndarrays until the stops are built.
         """
 
         points = self.path.points
@@ -53,25 +68,21 @@ class Layer:
         if not samples or len(samples) < 2:
             return [], False
 
-        # 2) color the samples with the current gradient widget
-        cols = self.gradient.points_to_colors(samples)
-        if not cols or len(cols) != len(samples):
-            return [], False
+        # 2) color the samples with the current gradient (one vectorized pass)
+        hsva, valid = self.gradient.color_at_batch(np.asarray(samples, dtype=np.float64))
 
-        # 3) build gradient stops (uniform by sample index -> [0..1])
-        stops: list[tuple[float, Color | None]] = []
-        N = len(samples)
-        for i in range(N):
-            c = cols[i]
-            t = i / (N - 1)
-            stops.append((t, c))
+        # 3) build gradient stops (uniform by sample index -> [0..1]);
+        #    positions are already non-decreasing, no sort needed
+        ts = np.linspace(0.0, 1.0, len(samples))
+        stops: list[tuple[float, Color | None]] = [
+            (t, Color(h=int(h), s=int(s), v=int(v), a=int(a)) if ok else None)
+            for t, (h, s, v, a), ok in zip(ts.tolist(), hsva.tolist(), valid.tolist())
+        ]
 
         # make sure we have at least 2 valid stops
         if len(stops) < 2:
             return [], False
 
-        # clamp/sort just in case (Qt expects non-decreasing positions)
-        stops.sort(key=lambda x: x[0])
         return stops, True
 
     def to_dict(self):
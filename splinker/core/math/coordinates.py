@@ -1,5 +1,8 @@
+from functools import lru_cache
 from typing import Literal
 
+import numpy as np
+
 Point = tuple[float, float]
 Op = tuple[Literal["M", "L", "C", "Z"], tuple]
 
@@ -11,25 +14,26 @@ def project_point_to_segment(p: Point, a: Point, b: Point) -> tuple[Point, float
     ax, ay = a; bx, by = b; px, py = p
     vx, vy = bx - ax, by - ay
     denom = vx * vx + vy * vy
-    if denom == 0.0:
-        dx = px - ax; dy = py - ay
-        return a, dx * dx + dy * dy
-    t = ((px - ax) * vx + (py - ay) * vy) / denom
-    if t < 0.0:
-        qx, qy = ax, ay
-    elif t > 1.0:
-        qx, qy = bx, by
-    else:
-        qx, qy = ax + t * vx, ay + t * vy
+    # degenerate segments fold into t=0 (projection onto the start point),
+    # and the endpoint branches collapse into a min/max clamp
+    inv = 0.0 if denom == 0.0 else 1.0 / denom
+    t = max(0.0, min(1.0, ((px - ax) * vx + (py - ay) * vy) * inv))
+    qx = ax + t * vx; qy = ay + t * vy
     dx = px - qx; dy = py - qy
     return (qx, qy), dx * dx + dy * dy
 
 
-def best_edge_index_for_insertion(path_points: list[Point], new_point: Point) -> int | None:
+def best_edge_index_for_insertion(path_points: list[Point], new_point: Point,
+                                  hint: int | None = None) -> int | None:
     """
     Return the index i of the edge (i -> i+1) that is closest to new_point by
     projection distance. For closed=True, includes the wrap edge (n-1 -> 0).
     Inserting at i+1 will place the new point on that edge.
+
+    `hint` is an optional edge index expected to be near the answer (e.g.
+    the previous insertion during a drag). It only seeds the pruning upper
+    bound, so the result is identical with or without it — a good hint just
+    lets the pre-filter discard more edges.
     """
     n = len(path_points)
     if n == 0:
@@ -37,20 +41,60 @@ def best_edge_index_for_insertion(path_points: list[Point], new_point: Point) ->
     if n == 1:
         return 0
 
-    best_i = 0
-    best_d2 = float("inf")
+    if n < 8:
+        # too few edges for the ndarray round-trip to pay off
+        best_i = 0
+        best_d2 = float("inf")
+        project = project_point_to_segment  # local binding for the loop
+        for i in range(n):
+            j = (i + 1) % n
+            _, d2 = project(new_point, path_points[i], path_points[j])
+            # <= makes tie-breaking stable toward later edges; use < if you prefer earlier
+            if d2 <= best_d2:
+                best_d2 = d2
+                best_i = i
+        return best_i
 
-    edge_count = n
-    for k in range(edge_count):
-        i = k
-        j = (i + 1) % n
-        _, d2 = project_point_to_segment(new_point, path_points[i], path_points[j])
-        # <= makes tie-breaking stable toward later edges; use < if you prefer earlier
-        if d2 <= best_d2:
-            best_d2 = d2
-            best_i = i
+    # vectorized: project onto all edges (incl. the wrap edge) in one pass
+    a = np.asarray(path_points, dtype=np.float64)
+    b = np.roll(a, -1, axis=0)
+    px, py = new_point
 
-    return best_i
+    # AABB pre-filter: an edge whose box is farther than the nearest vertex
+    # can never win, so only surviving edges pay for the full projection.
+    # Survivors can only be excluded strictly, so ties are preserved.
+    lo = np.minimum(a, b)
+    hi = np.maximum(a, b)
+    bx = np.maximum(np.maximum(lo[:, 0] - px, px - hi[:, 0]), 0.0)
+    by = np.maximum(np.maximum(lo[:, 1] - py, py - hi[:, 1]), 0.0)
+    upper = np.min((a[:, 0] - px) ** 2 + (a[:, 1] - py) ** 2)
+    if hint is not None:
+        # spatial locality: edges around the hinted one usually sit at or
+        # near the true distance, giving a much tighter bound than the
+        # nearest vertex alone. The relative slack absorbs ulp differences
+        # between this scalar projection and the vectorized bounds below,
+        # so the winning edge can never be pruned by its own distance.
+        for i in (hint - 1, hint, hint + 1):
+            _, d2 = project_point_to_segment(
+                new_point, path_points[i % n], path_points[(i + 1) % n])
+            d2 += d2 * 1e-9
+            if d2 < upper:
+                upper = d2
+    cand = np.nonzero(bx * bx + by * by <= upper)[0]
+
+    a = a[cand]
+    v = b[cand] - a
+    denom = v[:, 0] * v[:, 0] + v[:, 1] * v[:, 1]
+    degenerate = denom == 0.0
+    t = ((px - a[:, 0]) * v[:, 0] + (py - a[:, 1]) * v[:, 1]) / np.where(degenerate, 1.0, denom)
+    np.clip(t, 0.0, 1.0, out=t)
+    t[degenerate] = 0.0  # zero-length edge projects onto its start point
+    qx = a[:, 0] + t * v[:, 0]
+    qy = a[:, 1] + t * v[:, 1]
+    d2 = (px - qx) ** 2 + (py - qy) ** 2
+    # argmin over the reversed array keeps the scalar loop's <= tie-break
+    # (later edge wins on equal distance)
+    return int(cand[len(cand) - 1 - np.argmin(d2[::-1])])
 
 
 def _cubic_eval(p0: Point, c1: Point, c2: Point, p3: Point, t: float) -> Point:
@@ -63,46 +107,70 @@ def _cubic_eval(p0: Point, c1: Point, c2: Point, p3: Point, t: float) -> Point:
     y = uuu * p0[1] + 3.0 * uu * t * c1[1] + 3.0 * u * tt * c2[1] + ttt * p3[1]
     return (x, y)
 
+
+@lru_cache(maxsize=8)
+def _bernstein_basis(per: int) -> np.ndarray:
+    """(per, 4) cubic Bernstein basis over the uniform t grid i/per."""
+    t = np.arange(per, dtype=np.float64) / per
+    u = 1.0 - t
+    return np.stack([u * u * u, 3.0 * u * u * t, 3.0 * u * t * t, t * t * t], axis=1)
+
+
+def _sample_cubic_batch(p0s: np.ndarray, c1s: np.ndarray, c2s: np.ndarray,
+                        p3s: np.ndarray, per: int) -> np.ndarray:
+    """
+    Evaluate M cubic Bezier segments ((M, 2) arrays per control role) at
+    `per` uniform t values each; returns the (M * per, 2) sample array.
+    The basis matrix is shared across segments (and calls, via the cache),
+    so each segment costs one small matmul.
+    """
+    basis = _bernstein_basis(per)
+    ctrl = np.stack([p0s, c1s, c2s, p3s], axis=1)  # (M, 4, 2)
+    return np.einsum("ij,mjk->mik", basis, ctrl).reshape(-1, 2)
+
+
 def sample_cubic_path(pts: list[Point], closed: bool, seg_fn, total: int = 100) -> list[Point]:
     """
     Sample 'total' points across all cubic segments returned by seg_fn(pts, closed).
     Segments share samples evenly (simple and fast).
     """
-    if not pts:
+    if len(pts) == 0:  # pts may be a list or an (N, 2) ndarray (Path.xy)
         return []
-    # collect all segments and reconstruct p0 advancing along the path
-    segs = list(seg_fn(pts, closed))
-    if not segs:
+    # collect all segments and reconstruct p0 advancing along the path;
+    # editors may hand back the (M, 3, 2) ndarray directly (segments_array)
+    segs = seg_fn(pts, closed)
+    arr = segs if isinstance(segs, np.ndarray) \
+        else np.asarray(list(segs), dtype=np.float64)
+    if len(arr) == 0:
         # handle the open-line 2-point case
         if len(pts) == 2 and not closed:
             p0 = pts[0]; p1 = pts[1]
-            out: list[Point] = []
-            for i in range(total):
-                t = i / max(1, total - 1)
-                x = p0[0] + (p1[0] - p0[0]) * t
-                y = p0[1] + (p1[1] - p0[1]) * t
-                out.append((x, y))
-            return out
-        return [pts[0]]
-
-    # p0 starts at moveTo
-    p0 = pts[0]
-    m = len(segs)
-    per = max(1, total // m)
-    out: list[Point] = []
-    for idx, (c1, c2, p2) in enumerate(segs):
-        for i in range(per):
-            t = i / per
-            out.append(_cubic_eval(p0, c1, c2, p2, t))
-        p0 = p2
+            t = np.linspace(0.0, 1.0, total)
+            xs = p0[0] + (p1[0] - p0[0]) * t
+            ys = p0[1] + (p1[1] - p0[1]) * t
+            return list(zip(xs.tolist(), ys.tolist()))
+        return [(float(pts[0][0]), float(pts[0][1]))]
+
+    # p0 starts at moveTo, then advances to each segment's endpoint; the
+    # whole evaluation runs as one NumPy pass instead of nested loops
+    m = len(arr)
+    p0s = np.vstack([np.asarray(pts[0], dtype=np.float64)[None, :], arr[:-1, 2]])
+
+    # partition total-1 samples evenly across segments up front (the final
+    # endpoint is appended below), so no resampling/trim pass is needed
+    counts = np.diff(np.linspace(0, total - 1, m + 1).astype(np.int64))
+    pieces: list = [None] * m
+    for c in np.unique(counts):
+        if c == 0:
+            continue
+        idx = np.nonzero(counts == c)[0]
+        block = _sample_cubic_batch(
+            p0s[idx], arr[idx, 0], arr[idx, 1], arr[idx, 2], int(c)
+        ).reshape(len(idx), int(c), 2)
+        for k, seg_i in enumerate(idx):
+            pieces[seg_i] = block[k]
+    chunks = [piece for piece in pieces if piece is not None]
+    out = [tuple(p) for p in np.vstack(chunks).tolist()] if chunks else []
     # ensure last endpoint is included
-    out.append(p0)
-    # trim/extend to total if necessary
-    if len(out) > total:
-        step = (len(out) - 1) / (total - 1)
-        sel: list[Point] = []
-        for i in range(total):
-            j = int(round(i * step))
-            sel.append(out[j])
-        return sel
+    out.append((float(arr[-1, 2, 0]), float(arr[-1, 2, 1])))
     return out
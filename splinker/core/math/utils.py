@@ -1,3 +1,36 @@
+import numpy as np
+
+
+def rgb_to_hsv_255_batch(rgb: np.ndarray) -> np.ndarray:
+    """
+    Vectorized rgb_to_hsv_255 over an (N, 3) array of 0..255 channels.
+    Returns an (N, 3) uint16 array of (h, s, v) with h in [0, 359] and
+    s, v in [0, 255], matching the scalar function's rounding.
+    """
+    rgb = np.asarray(rgb, dtype=np.float64) / 255.0
+    rf, gf, bf = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+
+    cmax = rgb.max(axis=1)
+    cmin = rgb.min(axis=1)
+    delta = cmax - cmin
+    safe_delta = np.where(delta == 0.0, 1.0, delta)
+
+    h_deg = np.select(
+        [delta == 0.0, cmax == rf, cmax == gf],
+        [0.0,
+         60.0 * (((gf - bf) / safe_delta) % 6.0),
+         60.0 * (((bf - rf) / safe_delta) + 2.0)],
+        default=60.0 * (((rf - gf) / safe_delta) + 4.0),
+    )
+    s_f = np.where(cmax == 0.0, 0.0, delta / np.where(cmax == 0.0, 1.0, cmax))
+
+    out = np.empty((len(rgb), 3), dtype=np.uint16)
+    out[:, 0] = np.clip(np.rint(h_deg).astype(np.int64) % 360, 0, 359)
+    out[:, 1] = np.clip(np.rint(s_f * 255.0), 0, 255)
+    out[:, 2] = np.clip(np.rint(cmax * 255.0), 0, 255)
+    return out
+
+
 def rgb_to_hsv_255(r: int, g: int, b: int):
     # Input: r,g,b ∈ [0,255] (ints)
     # Output: (h, s, v) with h∈[0,359], s∈[0,255], v∈[0,255] (ints)
@@ -5,7 +38,12 @@ def rgb_to_hsv_255(r: int, g: int, b: int):
         raise TypeError("r, g, b must be integers.")
     if not (0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255):
         raise ValueError("r, g, b must be in [0,255].")
+    return _rgb_to_hsv_255_unchecked(r, g, b)
+
 
+def _rgb_to_hsv_255_unchecked(r: int, g: int, b: int):
+    # The conversion math without the validation gate; callers that already
+    # hold trusted 0..255 ints (Color, the batch kernel) come in here.
     rf = r / 255.0
     gf = g / 255.0
     bf = b / 255.0
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from pathlib import Path
 
 from splinker.config import SAVE_FOLDER
@@ -45,6 +44,17 @@ class Palette:
             raise KeyError(key)
         raise TypeError("key must be int or str")
 
+    def layer_index_for_name(self, name: str) -> int:
+        """
+        Index of the first layer with that name, or -1. One direct scan of
+        the layer list; not a maintained map, since Layer.name is a plain
+        mutable attribute that callers rename freely.
+        """
+        for i, layer in enumerate(self._layers):
+            if layer.name == name:
+                return i
+        return -1
+
     def set_name(self, name: str) -> None:
         self._name = name
 
@@ -81,7 +91,7 @@ class Palette:
         original = self._layers[index]
         new_layer = Layer(
             gradient=original.gradient,
-            path=deepcopy(original.path),
+            path=original.path.clone(),
             name=f"{original.name} Copy" if original.name else "Layer Copy",
         )
         return self.add_layer(new_layer)
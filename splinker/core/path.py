@@ -1,28 +1,90 @@
-from dataclasses import dataclass, field
 from typing import Sequence, TYPE_CHECKING
 
-from . import project_point_to_segment, dist2
-from .point_editors import PointEditorComponent, CatmullRomSplinePE
-from .registries import point_editor_registry
+import numpy as np
+
+from .point_editors import PointEditorComponent
+from .registries import get_point_editor, point_editor_names
 from splinker.core.math import Point
 
 if TYPE_CHECKING:
     from PySide6 import QtGui
 
 
-@dataclass()
 class Path:
     """
-      - points: control polygon vertices
+      - points: control polygon vertices (stored as an (N, 2) float64
+        ndarray; the `points` property serves a cached list-of-tuples view
+        for editors and serialization)
       - closed: whether the path is closed
       - spline: strategy to convert points -> cubic segments/ops
       - params: future-proof bag for per-path settings (kept opaque here)
     """
-    points: list[Point] = field(default_factory=list)
-    closed: bool = False
-    _editor: PointEditorComponent = field(default_factory=CatmullRomSplinePE)
-    params: dict[str, float] = field(default_factory=dict)
 
+    __slots__ = ("_rev", "_xy", "_points_view", "_closed", "_editor", "_params",
+                 "_sample_cache", "_qpath_cache")
+
+    def __init__(self, points: list[Point] | None = None, closed: bool = False,
+                 _editor: PointEditorComponent | None = None,
+                 params: dict[str, float] | None = None):
+        self._rev = 0
+        self._xy = np.empty((0, 2), dtype=np.float64)
+        self._points_view: list[Point] | None = []
+        self._closed = bool(closed)
+        self._editor = _editor if _editor is not None else get_point_editor("catmull-rom")
+        self._params = params  # allocated lazily; most paths never set any
+        # interpolate() memo: n -> (revision, samples list, samples ndarray)
+        self._sample_cache: dict = {}
+        # (revision, QPainterPath) reused across repaints of an idle path
+        self._qpath_cache: tuple | None = None
+        if points:
+            self.points = points
+
+    @property
+    def points(self) -> list[Point]:
+        view = self._points_view
+        if view is None:
+            view = self._points_view = list(map(tuple, self._xy.tolist()))
+        return view
+
+    @points.setter
+    def points(self, pts: list[Point]):
+        self._xy = np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+        self._points_view = None
+        self._rev += 1
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @closed.setter
+    def closed(self, value: bool):
+        self._closed = bool(value)
+        self._rev += 1
+
+    @property
+    def params(self) -> dict[str, float]:
+        if self._params is None:
+            self._params = {}
+        return self._params
+
+    @params.setter
+    def params(self, value: dict[str, float]):
+        self._params = value
+
+    @property
+    def revision(self) -> int:
+        """Monotonic counter bumped on every mutation; cheap cache key."""
+        return self._rev
+
+    @property
+    def xy(self) -> np.ndarray:
+        """
+        The control points as the underlying (N, 2) float64 array. Treat it
+        as read-only: mutate through the Path API so the revision counter
+        and caches stay honest. NumPy consumers prefer this over `points`
+        since it skips the tuple round-trip entirely.
+        """
+        return self._xy
 
     def clear(self):
         self.points = []
@@ -34,7 +96,26 @@ class Path:
         return tuple(self.points)
 
     def interpolate(self, n=200):
-        return self._editor.interpolate(self.points,self.closed,n)
+        return self._interpolate_cached(n)[0]
+
+    def _interpolate_cached(self, n: int) -> tuple[list[Point], "np.ndarray"]:
+        """
+        interpolate() plus its ndarray form, memoized against the revision
+        counter. Hover/drag and repaint all resample the same path, so the
+        editor only runs again after a mutation. Callers must treat the
+        returned containers as read-only.
+        """
+        rev = self.revision
+        entry = self._sample_cache.get(n)
+        if entry is not None and entry[0] == rev:
+            return entry[1], entry[2]
+        if self._sample_cache and next(iter(self._sample_cache.values()))[0] != rev:
+            self._sample_cache.clear()  # stale revision; cap memory
+        # editors accept the raw array; np.asarray on it is a no-op
+        samples = self._editor.interpolate(self._xy, self.closed, n)
+        arr = np.asarray(samples, dtype=np.float64).reshape(-1, 2)
+        self._sample_cache[n] = (rev, samples, arr)
+        return samples, arr
 
     def closest_point(self, point: Point) -> Point:
         """
@@ -44,25 +125,28 @@ class Path:
         projection to the resulting polyline is returned. If the path has no
         points, the input is returned unchanged.
         """
-        samples = self._editor.interpolate(self.points, self.closed, n=200)
+        samples, pts = self._interpolate_cached(200)
         if not samples:
             return point
-
-        best_point = samples[0]
-        best_d2 = dist2(point, best_point)
-
-        for a, b in zip(samples, samples[1:]):
-            candidate, d2 = project_point_to_segment(point, a, b)
-            if d2 < best_d2:
-                best_point = candidate
-                best_d2 = d2
-
-        if self.closed and len(samples) > 1 and samples[-1] != samples[0]:
-            candidate, d2 = project_point_to_segment(point, samples[-1], samples[0])
-            if d2 < best_d2:
-                best_point = candidate
-
-        return best_point
+        if len(samples) == 1:
+            return samples[0]
+
+        # project onto every polyline segment in one vectorized pass
+        if self.closed and samples[-1] != samples[0]:
+            pts = np.vstack([pts, pts[:1]])  # wrap segment
+        a = pts[:-1]
+        v = pts[1:] - a
+        denom = v[:, 0] * v[:, 0] + v[:, 1] * v[:, 1]
+        px, py = point
+        degenerate = denom == 0.0
+        t = ((px - a[:, 0]) * v[:, 0] + (py - a[:, 1]) * v[:, 1]) / np.where(degenerate, 1.0, denom)
+        np.clip(t, 0.0, 1.0, out=t)
+        t[degenerate] = 0.0
+        qx = a[:, 0] + t * v[:, 0]
+        qy = a[:, 1] + t * v[:, 1]
+        d2 = (px - qx) ** 2 + (py - qy) ** 2
+        k = int(np.argmin(d2))
+        return (float(qx[k]), float(qy[k]))
 
     def segments(self) -> Sequence[tuple[Point, Point, Point]]:
         return tuple(self._editor.segments(self.points, self.closed))
@@ -79,6 +163,15 @@ class Path:
         return self
 
     def edit_point(self, index: int, p: Point) -> "Path":
+        if self._editor.pointwise_edits:
+            # drag fast path: patch the one row in place instead of a full
+            # list round-trip per mouse-move (out-of-range edits are no-ops,
+            # matching the editor's behavior)
+            if 0 <= index < len(self._xy):
+                self._xy[index] = (float(p[0]), float(p[1]))
+                self._points_view = None
+                self._rev += 1
+            return self
         self.points = self._editor.edit_point(self.points, index, p)
         return self
 
@@ -95,11 +188,24 @@ class Path:
         # fit target controls
         new_points = new_editor.fit_from_sample(sample, self.closed)
         self._editor = new_editor
+        self._rev += 1  # editor swap invalidates cached samples too
         self.points = new_points
         self.closed = new_editor.default_closed or (self.closed if len(new_points) >= 3 else False)
         return self
 
 
+    def clone(self) -> "Path":
+        """
+        Independent copy without deepcopy's reflective walk: the point array
+        copies at C speed and the editor is shared (editors are stateless
+        strategies).
+        """
+        copy = Path(closed=self._closed, _editor=self._editor,
+                    params=dict(self._params) if self._params else None)
+        copy._xy = self._xy.copy()
+        copy._points_view = None
+        return copy
+
     # ---- serialization -------------------------------------------------------
     def to_dict(self) -> dict:
         """
@@ -110,34 +216,39 @@ class Path:
             "points": list(self.points),
             "closed": bool(self.closed),
             "params": dict(self.params),
-            "editor": {v:k for k,v in point_editor_registry.items()}.get(type(self._editor))
+            "editor": point_editor_names.get(type(self._editor))
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "Path":
         pts: list[Point] = [tuple(map(float, p)) for p in data["points"]]
         closed = data["closed"]
-        editor = point_editor_registry[data["editor"]]()
+        editor = get_point_editor(data["editor"])
         params = dict(data.get("params", {}))
         return cls(points=pts, closed=closed, _editor=editor, params=params)
 
     def make_qpath(self) -> "QtGui.QPainterPath":
         from PySide6 import QtCore, QtGui
-        pts = self.points
-        closed = self.closed
-        ops = self._editor.path_ops(pts, closed)
 
-        qp = QtGui.QPainterPath()
-        qpf = lambda t: QtCore.QPointF(t[0], t[1])
+        cached = self._qpath_cache
+        rev = self._rev
+        if cached is not None and cached[0] == rev:
+            return cached[1]
 
-        for op, data in ops:
-            if op == "M":
-                qp.moveTo(qpf(data))
+        ops, params = self._editor.path_ops_array(self.points, self.closed)
+        qp = QtGui.QPainterPath()
+        qpf = QtCore.QPointF  # hoisted: one global lookup per rebuild
+
+        for op, row in zip(ops, params.tolist()):
+            if op == "C":
+                qp.cubicTo(qpf(row[0], row[1]), qpf(row[2], row[3]),
+                           qpf(row[4], row[5]))
+            elif op == "M":
+                qp.moveTo(qpf(row[4], row[5]))
             elif op == "L":
-                qp.lineTo(qpf(data))
-            elif op == "C":
-                c1, c2, p2 = data
-                qp.cubicTo(qpf(c1), qpf(c2), qpf(p2))
+                qp.lineTo(qpf(row[4], row[5]))
             elif op == "Z":
                 qp.closeSubpath()
+
+        self._qpath_cache = (rev, qp)
         return qp
\ No newline at end of file
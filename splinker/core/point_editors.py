@@ -1,13 +1,34 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from splinker.core.math import Point, best_edge_index_for_insertion, Op, sample_cubic_path
 
 from .registries import register_point_editor
 
 
+def _catmull_segments(P: np.ndarray, closed: bool) -> np.ndarray:
+    """
+    Catmull-Rom -> cubic Bezier kernel: (N, 2) control points in, (M, 3, 2)
+    rows of (c1, c2, p2) out. Kept free of Python objects so the whole
+    recurrence runs as array ops (and could be handed to a JIT wholesale).
+    """
+    if closed:
+        padded = np.vstack([P[-1:], P, P[:2]])
+    else:
+        padded = np.vstack([P[:1], P, P[-1:]])
+    p0 = padded[:-3]; p1 = padded[1:-2]; p2 = padded[2:-1]; p3 = padded[3:]
+    c1 = p1 + (p2 - p0) / 6.0
+    c2 = p2 - (p3 - p1) / 6.0
+    return np.stack([c1, c2, p2], axis=1)
+
+
 class PointEditorComponent(ABC):
     max_number_points: int | None = None
     default_closed = False
+    # True when edit_point only ever moves the indexed point, letting Path
+    # patch its array in place during drags instead of rebuilding the list
+    pointwise_edits = False
 
     @abstractmethod
     def add_point(self, path_points: list[Point], new_point: Point, closed: bool) -> list[Point]:
@@ -31,8 +52,20 @@ class PointEditorComponent(ABC):
     @abstractmethod
     def segments(self, pts: list[Point], closed: bool, /) -> list[tuple[Point, Point, Point]]:
         """
-        Yield (c1, c2, p2) for each cubic segment, assuming a moveTo at pts[0].
+        Return (c1, c2, p2) for each cubic segment, assuming a moveTo at
+        pts[0]. A plain list: consumers iterate it in Python loops, where
+        list traversal beats resuming a generator frame per element.
+        """
+
+    def segments_array(self, pts: list[Point], closed: bool, /) -> np.ndarray:
+        """
+        segments() as an (M, 3, 2) float64 array; editors with a vector
+        formulation override this and derive segments() from it instead.
         """
+        segs = list(self.segments(pts, closed))
+        if not segs:
+            return np.empty((0, 3, 2), dtype=np.float64)
+        return np.asarray(segs, dtype=np.float64)
 
     def path_ops(self, pts: list[Point], closed: bool, /) -> list[Op]:
         """
@@ -57,6 +90,34 @@ class PointEditorComponent(ABC):
             ops.append(("Z", ()))
         return ops
 
+    def path_ops_array(self, pts: list[Point], closed: bool, /) -> tuple[str, np.ndarray]:
+        """
+        path_ops flattened for the painter loop: an opcode string over
+        "MLCZ" plus one (n_ops, 6) float64 row per op — [c1x, c1y, c2x,
+        c2y, x, y] for "C", the point in the last two columns for "M"/"L",
+        and an unused row for "Z". One contiguous array instead of a tuple
+        tree per segment.
+        """
+        n = len(pts)
+        if n == 0:
+            return "", np.empty((0, 6), dtype=np.float64)
+        if n == 1:
+            params = np.zeros((1, 6), dtype=np.float64)
+            params[0, 4:] = pts[0]
+            return "M", params
+        if n == 2 and not closed:
+            params = np.zeros((2, 6), dtype=np.float64)
+            params[0, 4:] = pts[0]
+            params[1, 4:] = pts[1]
+            return "ML", params
+        segs = self.segments_array(pts, closed)
+        m = len(segs)
+        ops = "M" + "C" * m + ("Z" if closed else "")
+        params = np.zeros((len(ops), 6), dtype=np.float64)
+        params[0, 4:] = pts[0]
+        params[1:m + 1] = segs.reshape(m, 6)
+        return ops, params
+
     @abstractmethod
     def fit_from_sample(self, sample: list[Point], closed: bool) -> list[Point]:
         """
@@ -80,6 +141,12 @@ class CatmullRomSplinePE(PointEditorComponent):
       - edit: set point.
     """
     max_number_points: int | None = None
+    pointwise_edits = True
+
+    def __init__(self):
+        # last insertion edge: consecutive insertions land near each other,
+        # so it seeds the search's pruning bound (never changes the result)
+        self._last_insert_i: int | None = None
 
     def add_point(self, path_points: list[Point], new_point: Point, closed: bool) -> list[Point]:
         pts = list(path_points)
@@ -91,10 +158,13 @@ class CatmullRomSplinePE(PointEditorComponent):
         if len(pts) < 2:
             pts.append(new_point)
             return pts
-        i = best_edge_index_for_insertion(pts, new_point)
+        hint = self._last_insert_i
+        i = best_edge_index_for_insertion(
+            pts, new_point, hint=hint if hint is not None and hint < len(pts) else None)
         if i is None:
             pts.append(new_point)
         else:
+            self._last_insert_i = i
             pts.insert(i + 1, new_point)
         return pts
 
@@ -112,23 +182,22 @@ class CatmullRomSplinePE(PointEditorComponent):
         pts[idx] = (float(edited_point[0]), float(edited_point[1]))
         return pts
 
-    def segments(self, pts: list[Point], closed: bool, /):
+    def segments_array(self, pts: list[Point], closed: bool, /) -> np.ndarray:
+        """
+        (M, 3, 2) float64 array of (c1, c2, p2) rows, one per cubic segment.
+        The scalar recurrence runs as slice arithmetic over a padded copy of
+        the control polygon, so long paths cost vector ops instead of per-
+        segment tuple churn.
+        """
         n = len(pts)
-        if n < 2:
-            return
-        if n == 2 and not closed:
-            return
-        if closed:
-            p = [pts[-1]] + list(pts) + [pts[0], pts[1]]
-        else:
-            p = [pts[0]] + list(pts) + [pts[-1]]
-        for i in range(1, len(p) - 2):
-            p0 = p[i - 1]; p1 = p[i]; p2 = p[i + 1]; p3 = p[i + 2]
-            c1 = (p1[0] + (p2[0] - p0[0]) / 6.0,
-                  p1[1] + (p2[1] - p0[1]) / 6.0)
-            c2 = (p2[0] - (p3[0] - p1[0]) / 6.0,
-                  p2[1] - (p3[1] - p1[1]) / 6.0)
-            yield (c1, c2, p2)
+        if n < 2 or (n == 2 and not closed):
+            return np.empty((0, 3, 2), dtype=np.float64)
+        return _catmull_segments(np.asarray(pts, dtype=np.float64), closed)
+
+    def segments(self, pts: list[Point], closed: bool, /) -> list[tuple[Point, Point, Point]]:
+        # tuple view over segments_array for callers that want Points
+        return [(tuple(c1), tuple(c2), tuple(p2))
+                for c1, c2, p2 in self.segments_array(pts, closed).tolist()]
 
     def fit_from_sample(self, sample: list[Point], closed: bool) -> list[Point]:
         """
@@ -140,18 +209,20 @@ class CatmullRomSplinePE(PointEditorComponent):
         n = len(sample)
         if n <= k:
             return [ (float(x), float(y)) for x,y in sample ]
-        out: list[Point] = []
-        for i in range(k):
-            j = int(round(i * (n - 1) / (k - 1)))
-            x, y = sample[j]
-            out.append((float(x), float(y)))
-        return out
+        arr = np.asarray(sample, dtype=np.float64)
+        idx = np.rint(np.linspace(0, n - 1, k)).astype(np.intp)
+        return [tuple(p) for p in arr[idx].tolist()]
 
     def interpolate(self, pts: list[Point], closed: bool, n=100) -> list[Point]:
         """
         Sample n points along the spline via cubic segments.
         """
-        return sample_cubic_path(pts, closed, self.segments, total=100)
+        return sample_cubic_path(pts, closed, self.segments_array, total=100)
+
+
+# distance from a quarter-circle endpoint to its cubic Bezier handle,
+# as a fraction of the radius: 4/3 * (sqrt(2) - 1)
+_KAPPA = 0.5522847498307936
 
 
 @register_point_editor("circle")
@@ -159,9 +230,18 @@ class CirclePE(PointEditorComponent):
     max_number_points: int | None = 2
     default_closed = True
 
+    def __init__(self):
+        # (center/radius key, ops list): the geometry only changes when one
+        # of the two control points moves, while repaints request it nonstop
+        self._ops_cache: tuple | None = None
+
     def path_ops(self, pts: list[Point], closed: bool, /):
         if len(pts) < 2:
             return []
+        key = (pts[0][0], pts[0][1], pts[1][0], pts[1][1])
+        cached = self._ops_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         cx, cy = pts[0]
         px, py = pts[1]
         rx = px - cx
@@ -170,7 +250,7 @@ class CirclePE(PointEditorComponent):
         if r <= 0.0:
             return []
 
-        k = 0.5522847498307936
+        k = _KAPPA
         a0 = (cx + r, cy)  # 0°
         a1 = (cx, cy + r)  # 90°
         a2 = (cx - r, cy)  # 180°
@@ -189,7 +269,7 @@ class CirclePE(PointEditorComponent):
         c13 = (a3[0] + k * r, a3[1])
         c23 = (a0[0], a0[1] - k * r)
 
-        return [
+        ops = [
             ("M", a0),
             ("C", (c10, c20, a1)),
             ("C", (c11, c21, a2)),
@@ -197,6 +277,26 @@ class CirclePE(PointEditorComponent):
             ("C", (c13, c23, a0)),
             ("Z", ()),
         ]
+        self._ops_cache = (key, ops)
+        return ops
+
+    def path_ops_array(self, pts: list[Point], closed: bool, /) -> tuple[str, np.ndarray]:
+        # flatten the memoized path_ops rather than going through
+        # segments_array: the two historically place handles differently
+        # (tangent construction vs toward-center), and the painter must
+        # keep drawing the tangent version
+        ops = self.path_ops(pts, closed)
+        if not ops:
+            return "", np.empty((0, 6), dtype=np.float64)
+        codes = "".join(op for op, _ in ops)
+        params = np.zeros((len(ops), 6), dtype=np.float64)
+        for i, (op, data) in enumerate(ops):
+            if op == "C":
+                c1, c2, p2 = data
+                params[i] = (*c1, *c2, *p2)
+            elif op == "M":
+                params[i, 4:] = data
+        return codes, params
 
     def add_point(self, path_points: list[Point], new_point: Point, closed: bool) -> list[Point]:
         # Always enforce 2 points: [center, on_radius]
@@ -231,32 +331,31 @@ class CirclePE(PointEditorComponent):
             return [(float(c0x), float(c0y)), (float(edited_point[0]), float(edited_point[1]))]
         return list(path_points)
 
-    def segments(self, pts: list[Point], closed: bool, /):
+    def segments_array(self, pts: list[Point], closed: bool, /) -> np.ndarray:
+        """
+        (4, 3, 2) array of (c1, c2, p2) rows for the four quarter arcs,
+        built from one cardinal-point array instead of a dozen tuples.
+        """
         if len(pts) < 2:
-            return
+            return np.empty((0, 3, 2), dtype=np.float64)
         cx, cy = pts[0]
         px, py = pts[1]
         rx = px - cx; ry = py - cy
         r = (rx*rx + ry*ry) ** 0.5
         if r == 0.0:
-            return
-        k = 0.5522847498307936
-        def seg(ax, ay, bx, by, cx2, cy2):
-            c1 = (ax + k * (cx2 - ax), ay + k * (cy2 - ay))
-            c2 = (bx + k * (cx2 - bx), by + k * (cy2 - by))
-            return c1, c2, (bx, by)
-        a0 = (cx + r, cy)
-        a1 = (cx, cy + r)
-        a2 = (cx - r, cy)
-        a3 = (cx, cy - r)
-        s0 = seg(a0[0], a0[1], a1[0], a1[1], cx, cy)
-        s1 = seg(a1[0], a1[1], a2[0], a2[1], cx, cy)
-        s2 = seg(a2[0], a2[1], a3[0], a3[1], cx, cy)
-        s3 = seg(a3[0], a3[1], a0[0], a0[1], cx, cy)
-        yield s0[0], s0[1], s0[2]
-        yield s1[0], s1[1], s1[2]
-        yield s2[0], s2[1], s2[2]
-        yield s3[0], s3[1], s3[2]
+            return np.empty((0, 3, 2), dtype=np.float64)
+        center = np.array([cx, cy], dtype=np.float64)
+        a = np.array([[cx + r, cy], [cx, cy + r], [cx - r, cy], [cx, cy - r]],
+                     dtype=np.float64)
+        b = np.roll(a, -1, axis=0)
+        c1 = a + _KAPPA * (center - a)
+        c2 = b + _KAPPA * (center - b)
+        return np.stack([c1, c2, b], axis=1)
+
+    def segments(self, pts: list[Point], closed: bool, /) -> list[tuple[Point, Point, Point]]:
+        # tuple view over segments_array for callers that want Points
+        return [(tuple(c1), tuple(c2), tuple(p2))
+                for c1, c2, p2 in self.segments_array(pts, closed).tolist()]
 
     def fit_from_sample(self, sample: list[Point], closed: bool) -> list[Point]:
         """
@@ -268,23 +367,18 @@ class CirclePE(PointEditorComponent):
             c = (0.0, 0.0)
             r = (100.0, 0.0)
             return [c, r]
-        sx = 0.0; sy = 0.0
-        for x, y in sample:
-            sx += float(x); sy += float(y)
-        cx = sx / n; cy = sy / n
+        A = np.asarray(sample, dtype=np.float64)
+        c = A.mean(axis=0)
+        cx = float(c[0]); cy = float(c[1])
         if n == 1:
             return [(cx, cy), (cx + 100.0, cy)]
         # mean radius
-        sr = 0.0
-        for x, y in sample:
-            dx = float(x) - cx; dy = float(y) - cy
-            sr += (dx*dx + dy*dy) ** 0.5
-        r = sr / n if n > 0 else 100.0
+        r = float(np.linalg.norm(A - c, axis=1).mean())
         return [(cx, cy), (cx + r, cy)]
 
     def interpolate(self, pts: list[Point], closed: bool, n=100) -> list[Point]:
         """
         Sample n points along the circle using the cubic approximation.
         """
-        return sample_cubic_path(pts, closed, self.segments, total=100)
+        return sample_cubic_path(pts, closed, self.segments_array, total=100)
 
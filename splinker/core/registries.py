@@ -4,14 +4,30 @@ if TYPE_CHECKING:
     from .point_editors import PointEditorComponent
 
 point_editor_registry: dict[str, type["PointEditorComponent"]] = {}
+# inverse view maintained by register_point_editor, so serialization can
+# resolve an editor's name without rebuilding the inverted dict per call
+point_editor_names: dict[type["PointEditorComponent"], str] = {}
+# shared instances, filled lazily by get_point_editor: editors take the
+# points as arguments and keep no per-path state, so one object of each
+# class serves every Path
+point_editor_instances: dict[str, "PointEditorComponent"] = {}
 gradient_registry: dict[str, type["Gradient"]] = {}
 
 
+def get_point_editor(name: str) -> "PointEditorComponent":
+    """The shared editor instance registered under `name`."""
+    inst = point_editor_instances.get(name)
+    if inst is None:
+        inst = point_editor_instances[name] = point_editor_registry[name]()
+    return inst
+
+
 def register_point_editor(name: str):
     def _decorator(cls: type["PointEditorComponent"]) -> type["PointEditorComponent"]:
         if not name or name in point_editor_registry:
             raise ValueError(f"Invalid or duplicate point editor name '{name}'")
         point_editor_registry[name] = cls
+        point_editor_names[cls] = name
         return cls
     return _decorator
 
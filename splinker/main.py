@@ -1,11 +1,32 @@
 import sys
+from contextlib import contextmanager
 
 from PySide6 import QtCore, QtWidgets
 
-from splinker.core import HsvSquareGradient, CatmullRomSplinePE, Layer, Path, Palette
+from splinker.core import HsvSquareGradient, Layer, Path, Palette
 from splinker.menu import Bar, MenuBar, PaletteGradientBar
 from splinker.widgets import CanvasWidget
 
+
+@contextmanager
+def connection_queue():
+    """
+    Collects signal/slot pairs and performs the actual connects only when
+    the block exits. Keeps half-built widgets from receiving emits that
+    constructors may fire during setup.
+    """
+    pending: list[tuple] = []
+
+    class _Queue:
+        @staticmethod
+        def connect(signal, slot):
+            pending.append((signal, slot))
+
+    yield _Queue()
+    for signal, slot in pending:
+        signal.connect(slot)
+
+
 class MyWidget(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
@@ -34,9 +55,11 @@ class MyWidget(QtWidgets.QWidget):
         self.layout.addWidget(self.top_bar, alignment=QtCore.Qt.AlignmentFlag.AlignTop)
         self.layout.addLayout(self.main_layout)
 
-        self.canvas.overlayUpdated.connect(self.menu_bar.refresh)
-        self.canvas.display.pointsChanged.connect(self.menu_bar.refresh)
-        self.menu_bar.tabChanged.connect(self.canvas.on_tab_changed)
+        # wire everything only once all widgets exist
+        with connection_queue() as conn:
+            conn.connect(self.canvas.overlayUpdated, self.menu_bar.refresh)
+            conn.connect(self.canvas.display.pointsChanged, self.menu_bar.refresh)
+            conn.connect(self.menu_bar.tabChanged, self.canvas.on_tab_changed)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
-from PySide6 import QtWidgets, QtGui
+import numpy as np
+from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtGui import QColor
 
-from splinker.core import Color
+from splinker.core.math.colors import _make_qcolor
 from splinker.widgets import CanvasWidget
 
+# shared fill for samples the gradient declines to color (QLinearGradient
+# copies stop colors, so one instance serves every stop)
+_TRANSPARENT = QtGui.QColor(0, 0, 0, 0)
+
 
 class PaletteGradientBar(QtWidgets.QWidget):
     def __init__(self, overlay: CanvasWidget, parent=None):
@@ -11,9 +16,48 @@ class PaletteGradientBar(QtWidgets.QWidget):
         self._overlay = overlay
         self.setMinimumWidth(28)
         self.setSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Expanding)
-        self._overlay.overlayUpdated.connect(self.update)
-        self._overlay.activeLayerChanged.connect(self.update)
-        self._overlay.overlaysChanged.connect(self.update)
+        # stops survive between repaints: the overlay signals schedule a
+        # repaint, and the fingerprint of (layer, path revision, gradient)
+        # decides whether the cached list is still good — a signal that
+        # changed nothing relevant costs no recompute
+        self._stops_cache: tuple | None = None  # (key, stops, ok)
+        # 1-pixel-wide render of the current stops, scaled onto the bar at
+        # paint time; keyed by stop-list identity so it follows _stops_cache
+        self._grad_pixmap: tuple | None = None  # (stops, QPixmap)
+        # a drag can fire all three signals for one user action; the
+        # zero-delay timer folds them into a single repaint per event-loop
+        # turn
+        self._repaint_pending = False
+        # updates that arrive while the bar is hidden (other tab active)
+        # collapse into one repaint on the next showEvent
+        self._hidden_dirty = False
+        self._overlay.overlayUpdated.connect(self._schedule_update)
+        self._overlay.activeLayerChanged.connect(self._schedule_update)
+        self._overlay.overlaysChanged.connect(self._schedule_update)
+
+    def _schedule_update(self, /):
+        if not self.isVisible():
+            self._hidden_dirty = True
+            return
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QtCore.QTimer.singleShot(0, self._do_update)
+
+    def _do_update(self, /):
+        self._repaint_pending = False
+        self.update()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._hidden_dirty:
+            self._hidden_dirty = False
+            self.update()
+
+    def _stops_key(self, /):
+        layer_widget = self._overlay.active_layer
+        if layer_widget is None:
+            return None
+        return (id(layer_widget), layer_widget.path.revision, id(layer_widget.gradient))
 
     def _collect_stops(self, /):
         """
@@ -37,33 +81,34 @@ class PaletteGradientBar(QtWidgets.QWidget):
         if not samples or len(samples) < 2:
             return [], False
 
-        # 2) color the samples with the current gradient widget
-        if layer_widget is None:
-            return [], False
-        cols = layer_widget.gradient.points_to_colors(samples)
-        if not cols or len(cols) != len(samples):
+        # 2) color the samples in one batch call; no intermediate Color
+        #    objects, the hsva rows go straight to (cached) QColors
+        hsva, valid = layer_widget.gradient.color_at_batch(
+            np.asarray(samples, dtype=np.float64))
+        if len(hsva) != len(samples):
             return [], False
 
-        # 3) build gradient stops (uniform by sample index -> [0..1])
+        # 3) build gradient stops (uniform by sample index -> [0..1]);
+        #    the positions come out of one linspace instead of a division
+        #    per sample, and the hot names are bound once outside the loop
         stops: list[tuple[float, QtGui.QColor]] = []
+        append = stops.append
         N = len(samples)
+        ts = np.linspace(0.0, 1.0, N).tolist()
+        rows = hsva.tolist()
+        oks = valid.tolist()
         for i in range(N):
-            c = cols[i]
-            if isinstance(c, Color):
-                c = c.to_QColor()
-            if c is None:
-                t = i / (N - 1)
-                stops.append((t, QtGui.QColor(0,0,0,0)))
-            elif c.isValid():
-                t = i / (N - 1)
-                stops.append((t, c))
+            if oks[i]:
+                h, s, v, _a = rows[i]
+                append((ts[i], _make_qcolor(h, s, v)))
+            else:
+                append((ts[i], _TRANSPARENT))
 
         # make sure we have at least 2 valid stops
         if len(stops) < 2:
             return [], False
 
-        # clamp/sort just in case (Qt expects non-decreasing positions)
-        stops.sort(key=lambda t: t[0])
+        # positions come from linspace, already non-decreasing as Qt expects
         return stops, True
 
 
@@ -74,18 +119,35 @@ class PaletteGradientBar(QtWidgets.QWidget):
         rect = self.rect()
         p.fillRect(rect, self.palette().window())
 
-        stops, ok = self._collect_stops()
+        key = self._stops_key()
+        cached = self._stops_cache
+        if cached is not None and cached[0] == key:
+            stops, ok = cached[1], cached[2]
+        else:
+            stops, ok = self._collect_stops()
+            self._stops_cache = (key, stops, ok)
         if not ok or len(stops) < 2:
             # show a faint placeholder
             p.fillRect(rect.adjusted(2, 2, -2, -2), QtGui.QColor(220, 220, 220))
             p.end()
             return
 
-        grad = QtGui.QLinearGradient(rect.center().x(), rect.top(), rect.center().x(), rect.bottom())
-        for s, c in stops:
-            grad.setColorAt(s, c)
-
-        p.fillRect(rect.adjusted(1, 1, -1, -1), grad)
+        cached_pm = self._grad_pixmap
+        if cached_pm is None or cached_pm[0] is not stops:
+            # render the gradient once per stop list into a 1-wide strip;
+            # repaints then cost a scaled blit instead of per-pixel
+            # gradient interpolation
+            pm = QtGui.QPixmap(1, 1024)
+            grad = QtGui.QLinearGradient(0.0, 0.0, 0.0, 1024.0)
+            # one binding crossing for the whole stop list instead of one
+            # setColorAt call per stop
+            grad.setStops(stops)
+            pp = QtGui.QPainter(pm)
+            pp.fillRect(0, 0, 1, 1024, grad)
+            pp.end()
+            cached_pm = self._grad_pixmap = (stops, pm)
+
+        p.drawPixmap(rect.adjusted(1, 1, -1, -1), cached_pm[1])
         # thin frame
         p.setPen(QtGui.QPen(self.palette().mid().color()))
         p.drawRect(rect.adjusted(0, 0, -1, -1))
@@ -23,11 +23,9 @@ class MenuBar(QtWidgets.QTabWidget):
         self._palette_tab = QtWidgets.QWidget(self)
         self._actions_tab = QtWidgets.QWidget(self)
 
-        self._palette_tab.setLayout(QtWidgets.QVBoxLayout())
-        self._palette_tab.layout().addStretch(1)
-
-        self._actions_tab.setLayout(QtWidgets.QVBoxLayout())
-        self._actions_tab.layout().addStretch(1)
+        # build each tab's layout exactly once, parented at construction
+        QtWidgets.QVBoxLayout(self._palette_tab).addStretch(1)
+        QtWidgets.QVBoxLayout(self._actions_tab).addStretch(1)
 
         self.addTab(self._path_tab, "Path")
         self.addTab(self._palette_tab, "Palette")
@@ -43,9 +41,11 @@ class MenuBar(QtWidgets.QTabWidget):
     def set_points(self, pts: list[QtCore.QPointF], /):
         return
 
+    @QtCore.Slot()
     def refresh(self, /):
         self._path_tab.refresh_all()
 
+    @QtCore.Slot(int)
     def _on_tab_changed(self, index: int):
         name = self.tabText(index)
         self.tabChanged.emit(name)
@@ -1,9 +1,78 @@
+import re
+from functools import partial
+from itertools import zip_longest
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from splinker.core import gradient_registry, point_editor_registry, Color, Layer
+from splinker.core import gradient_registry, point_editor_registry, get_point_editor, Color, Layer
 from splinker.widgets import CanvasWidget
 from splinker.core.point_editors import PointEditorComponent
 
+# matches a whole row like "03: 255, 128, 0" (the "NN:" prefix is optional so
+# bare "r, g, b" stays accepted); anchoring both ends means a missing channel
+# is rejected instead of the prefix getting read as red
+_RGB_RE = re.compile(r"^\s*(?:\d+\s*:\s*)?(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*$")
+
+# shared pens for the row delegate: only two foregrounds ever exist, so
+# allocate them once instead of one QColor per paint
+_PEN_BLACK = QtGui.QColor(0, 0, 0)
+_PEN_WHITE = QtGui.QColor(255, 255, 255)
+# luma decision per packed rgb; rows repaint far more often than their
+# colors change
+_PEN_CACHE: dict[int, QtGui.QColor] = {}
+
+# each point row carries its index here, sparing QListWidget.row()'s
+# linear scan in the edit handlers (rows only ever grow/shrink at the
+# tail, so stored indices never go stale)
+_ROW_ROLE = int(QtCore.Qt.UserRole) + 1
+
+# cache-miss sentinel; None is a legitimate cached point_at result
+_MISS = object()
+
+
+def _format_rgb_text(idx: int, color: Color | None, /) -> str:
+    if color is None or not color.isValid():
+        return f"{idx:02d}: (?, ?, ?)"
+    r, g, b = color.to_rgb()
+    return f"{idx:02d}: {r}, {g}, {b}"
+
+
+class ColorRowDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints a point row directly from its UserRole color, bypassing the
+    per-item QBrush/style-sheet machinery (much cheaper on long lists).
+    Rows without a valid color (including the adder row) fall back to the
+    default delegate.
+    """
+
+    def paint(self, painter: QtGui.QPainter, option, index):
+        data = index.data(QtCore.Qt.UserRole)
+        if isinstance(data, QtGui.QColor):
+            qcolor = data if data.isValid() else None
+        elif isinstance(data, Color) and data.isValid():
+            qcolor = data.to_QColor()
+        else:
+            qcolor = None
+        if qcolor is None:
+            super().paint(painter, option, index)
+            return
+
+        painter.fillRect(option.rect, qcolor)
+        rgb = qcolor.rgb()
+        pen = _PEN_CACHE.get(rgb)
+        if pen is None:
+            if len(_PEN_CACHE) > 4096:
+                _PEN_CACHE.clear()
+            # integer Rec.709 luma scaled by 256; 39168 == 0.6 * 255 * 256
+            lum = 54 * qcolor.red() + 183 * qcolor.green() + 19 * qcolor.blue()
+            pen = _PEN_CACHE[rgb] = _PEN_BLACK if lum > 39168 else _PEN_WHITE
+        painter.setPen(pen)
+        painter.drawText(
+            option.rect.adjusted(4, 0, -4, 0),
+            QtCore.Qt.AlignmentFlag.AlignVCenter | QtCore.Qt.AlignmentFlag.AlignLeft,
+            index.data(QtCore.Qt.DisplayRole) or "",
+        )
+
 
 class LayerItem(QtWidgets.QWidget):
     """
@@ -26,11 +95,9 @@ class LayerItem(QtWidgets.QWidget):
         self._gear.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextOnly)
         self._gear.setPopupMode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
 
-        # find layer idx by name
-        for i in range(len(self._overlay)):
-            if self._overlay[i].name == self._layer_name:
-                self._layer_idx = i
-                break
+        # find layer idx by name (one palette-side scan, no per-layer
+        # round-trips through the canvas)
+        self._layer_idx = self._overlay.layer_index_for_name(self._layer_name)
         if self._layer_idx < 0:
             try:
                 self._layer_idx = self._overlay.get_active_idx()
@@ -43,6 +110,28 @@ class LayerItem(QtWidgets.QWidget):
 
         self._list = QtWidgets.QListWidget(self)
         self._list.setUniformItemSizes(True)
+        self._list.setItemDelegate(ColorRowDelegate(self._list))
+        # one explicit size hint shared by every row; with uniform item
+        # sizes set, Qt then never measures row contents at all
+        self._row_size = QtCore.QSize(0, self._list.fontMetrics().height() + 6)
+
+        # gradient.point_at memo: packed rgb -> point (or None), valid for
+        # one gradient object at a time
+        self._point_at_cache: dict = {}
+        self._point_at_grad = None
+        # itemChanged storms (programmatic rewrites, rapid re-edits) park
+        # their validated colors here, keyed by row; one timer tick applies
+        # only the last value per row
+        self._pending_edits: dict[int, QtGui.QColor] = {}
+        self._edit_timer = QtCore.QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.timeout.connect(self._flush_pending_edits)
+        # cached (text, hsva-key) per row so refresh only touches changed rows
+        self._last_rows: list[tuple[str, tuple | None]] = []
+        # (path revision, gradient) snapshot of the last completed refresh
+        self._refreshed_state: tuple | None = None
+        self._adder_item = self._make_adder_item()
+        self._list.addItem(self._adder_item)
 
         head = QtWidgets.QHBoxLayout()
         head.setContentsMargins(0, 0, 0, 0)
@@ -62,25 +151,37 @@ class LayerItem(QtWidgets.QWidget):
         # live refresh with spline changes
         self.overlay.display.pointsChanged.connect(self.refresh)
 
+        # the gear menu's actions are only built on first popup; most rows
+        # never get their gear opened, so startup skips the action churn
         menu = QtWidgets.QMenu(self._gear)
-        grad_menu = menu.addMenu("Gradient")
-        for name, grad_cls in gradient_registry.items():
-            act = grad_menu.addAction(name)
-            # bind class to action
-            act.triggered.connect(lambda _=False, cls=grad_cls: self._apply_registry_gradient(cls))
-        spline_menu = menu.addMenu("Spline type")
-        for key, editor_cls in point_editor_registry.items():  # dict[str, type[PointEditorComponent]]
-            act = spline_menu.addAction(key)
-            # bind the registry key to the action
-            act.triggered.connect(lambda _=False, k=key: self._apply_point_editor(k))
-
+        self._gear_menu_built = False
+        menu.aboutToShow.connect(self._build_gear_menu)
         self._gear.setMenu(menu)
 
         self._overlay.overlayUpdated.connect(self._on_overlay_updated)
         self._overlay.layerNameChanged.connect(self._on_layer_name_changed)
+        self._overlay_connected = True
+        # refreshes that land while the row is hidden (left bar collapsed,
+        # row scrolled out) collapse into one rebuild on the next showEvent
+        self._pending_refresh = False
         self.installEventFilter(self)
         self.refresh()
 
+    def _build_gear_menu(self, /):
+        if self._gear_menu_built:
+            return
+        self._gear_menu_built = True
+        menu = self._gear.menu()
+        grad_menu = menu.addMenu("Gradient")
+        for name, grad_cls in gradient_registry.items():
+            act = grad_menu.addAction(name)
+            # partial binds the class without a closure per action
+            act.triggered.connect(partial(self._apply_registry_gradient, grad_cls))
+        spline_menu = menu.addMenu("Spline type")
+        for key, editor_cls in point_editor_registry.items():  # dict[str, type[PointEditorComponent]]
+            act = spline_menu.addAction(key)
+            act.triggered.connect(partial(self._apply_point_editor, key))
+
     @property
     def layer_name(self) -> str:
         if self._layer_idx < 0 or self._layer_idx >= len(self._overlay):
@@ -98,14 +199,21 @@ class LayerItem(QtWidgets.QWidget):
         return self._overlay
 
     # ----- inline title editing ----------------------------------------
+    # the filter sees every event (paint, hover, tooltip, focus...); gate
+    # on the enum first so the common case is one int comparison
+    _MOUSE_TYPES = (QtCore.QEvent.Type.MouseButtonPress,
+                    QtCore.QEvent.Type.MouseButtonDblClick)
+
     def eventFilter(self, obj, ev):
-        if isinstance(ev, QtGui.QMouseEvent):
-            if ev.type() == QtCore.QEvent.Type.MouseButtonPress and ev.button() == QtCore.Qt.MouseButton.LeftButton:
+        t = ev.type()
+        if t not in self._MOUSE_TYPES:
+            return super().eventFilter(obj, ev)
+        if ev.button() == QtCore.Qt.MouseButton.LeftButton:
+            if t == QtCore.QEvent.Type.MouseButtonPress:
                 self._activate_self()
-                return True
-            if ev.type() == QtCore.QEvent.Type.MouseButtonDblClick and ev.button() == QtCore.Qt.MouseButton.LeftButton:
+            else:
                 self._begin_title_edit()
-                return True
+            return True
         return super().eventFilter(obj, ev)
 
     def _begin_title_edit(self):
@@ -126,6 +234,7 @@ class LayerItem(QtWidgets.QWidget):
         self._title_editor.show()
         self._title_editor.setFocus(QtCore.Qt.FocusReason.MouseFocusReason)
 
+    @QtCore.Slot()
     def _commit_title_edit(self):
         if self._title_editor is None:
             return
@@ -157,34 +266,54 @@ class LayerItem(QtWidgets.QWidget):
             return
         super().keyPressEvent(ev)
 
+    def detach(self, /):
+        """
+        Drop this row's overlay signal connections. QListWidget.clear()
+        deletes item widgets without delivering close events, so owners
+        must call this before discarding the row — otherwise it keeps
+        receiving overlay signals and refreshing a dead list.
+        """
+        if self._overlay_connected:
+            self._overlay_connected = False
+            self._overlay.overlayUpdated.disconnect(self._on_overlay_updated)
+            self._overlay.layerNameChanged.disconnect(self._on_layer_name_changed)
+            self._overlay.display.pointsChanged.disconnect(self.refresh)
+
+    def showEvent(self, ev):
+        super().showEvent(ev)
+        if self._pending_refresh:
+            self.refresh()
+
     # ----- data refresh ------------------------------------------------------
+    @QtCore.Slot()
     def refresh(self, /):
-        if self.layer is None:
-            self._list.clear()
+        # a hidden row has nothing to show; remember that data moved and
+        # catch up once on showEvent instead of per edit
+        if not self.isVisible():
+            self._pending_refresh = True
+            return
+        self._pending_refresh = False
+        # the row always fronts a concrete Layer/Path pair, so no need to
+        # probe for callables: access points/point_colors directly
+        if self._layer_idx < 0 or self._layer_idx >= len(self._overlay):
+            # the backing layer was removed; show an empty row
+            self.set_points_and_colors([], None)
+            return
+        layer = self.layer
+        if layer is None:
+            self.set_points_and_colors([], None)
             return
 
-        # points
-        pts_attr = self.layer.path.points
-        pts = pts_attr() if callable(pts_attr) else (pts_attr or [])
-
-        # colors
-        colors = self.layer.point_colors()
-
-        self.set_points_and_colors(pts or [], colors)
+        # O(1) skip when nothing changed since the last refresh
+        path = layer.path
+        state = (path.revision, layer.gradient)
+        if state == self._refreshed_state:
+            return
 
-    def set_points_and_colors(self, pts: list[QtCore.QPointF], colors: list | None, /):
-        self._block_item_changed = True
-        self._list.clear()
-        n = len(pts)
-        for i in range(n):
-            c = (colors[i] if (colors and i < len(colors)) else None)
-            text = self._format_rgb_text(i, c)
-            item = QtWidgets.QListWidgetItem(text)
-            item.setFlags(item.flags() | QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self._apply_item_brushes(item, c)
-            item.setData(QtCore.Qt.UserRole, c)  # store QColor (or None)
-            self._list.addItem(item)
+        self.set_points_and_colors(path.points, layer.point_colors())
+        self._refreshed_state = state
 
+    def _make_adder_item(self, /) -> QtWidgets.QListWidgetItem:
         add_item = QtWidgets.QListWidgetItem("+ Add point…")
         f = add_item.font()
         f.setBold(True)
@@ -192,33 +321,74 @@ class LayerItem(QtWidgets.QWidget):
         add_item.setTextAlignment(int(QtCore.Qt.AlignmentFlag.AlignCenter))
         add_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
         add_item.setData(QtCore.Qt.UserRole, "__adder__")
-        self._list.addItem(add_item)
+        add_item.setSizeHint(self._row_size)
+        return add_item
 
-        self._block_item_changed = False
+    @staticmethod
+    def _row_key(color: Color | None, /) -> tuple | None:
+        return color.to_hsva() if color is not None else None
 
-    # ----- formatting & painting --------------------------------------------
-    def _format_rgb_text(self, idx: int, color: Color | None, /) -> str:
-        if color is None or not color.isValid():
-            return f"{idx:02d}: (?, ?, ?)"
-        r, g, b = color.to_rgb()
-        return f"{idx:02d}: {r}, {g}, {b}"
-
-    def _apply_item_brushes(self, item: QtWidgets.QListWidgetItem, color: Color | None, /):
-        if color is None or not color.isValid():
-            item.setBackground(QtGui.QBrush())
-            item.setForeground(QtGui.QBrush())
-            return
-        item.setBackground(QtGui.QBrush(color.to_QColor()))
-        r, g, b = color.to_rgb()
-        lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
-        fg = QtGui.QColor(0, 0, 0) if lum > 0.6 else QtGui.QColor(255, 255, 255)
-        item.setForeground(QtGui.QBrush(fg))
+    def set_points_and_colors(self, pts: list[QtCore.QPointF], colors: list | None, /):
+        """
+        Diff the incoming rows against the current list and only touch items
+        whose text/color changed; the list (and the trailing adder row) is
+        never rebuilt wholesale.
+        """
+        rows: list[tuple[str, Color | None]] = [
+            (_format_rgb_text(i, c), c)
+            for i, (_, c) in enumerate(zip_longest(pts, colors or (), fillvalue=None))
+        ]
+
+        self._block_item_changed = True
+        self._list.setUpdatesEnabled(False)
+        # silence the widget-level signals (itemChanged, selection churn)
+        # for the whole batch; the view/model sync itself stays intact
+        was_blocked = self._list.blockSignals(True)
+        try:
+            old = self._last_rows
+            n_old, n_new = len(old), len(rows)
+
+            # rewrite rows whose content changed
+            for i in range(min(n_old, n_new)):
+                text, c = rows[i]
+                if old[i] == (text, self._row_key(c)):
+                    continue
+                item = self._list.item(i)
+                item.setText(text)
+                item.setData(QtCore.Qt.UserRole, c)  # store Color (or None)
+
+            # grow: insert new rows just before the adder (hot Qt names
+            # resolved once, not per row)
+            make_item = QtWidgets.QListWidgetItem
+            flags = (QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsEnabled
+                     | QtCore.Qt.ItemIsSelectable)
+            user_role = QtCore.Qt.UserRole
+            insert = self._list.insertItem
+            for i in range(n_old, n_new):
+                text, c = rows[i]
+                item = make_item(text)
+                item.setFlags(item.flags() | flags)
+                item.setData(user_role, c)
+                item.setData(_ROW_ROLE, i)
+                item.setSizeHint(self._row_size)
+                insert(i, item)
+
+            # shrink: drop excess rows from the tail (adder stays last)
+            for i in range(n_old, n_new, -1):
+                self._list.takeItem(i - 1)
+
+            self._last_rows = [(text, self._row_key(c)) for text, c in rows]
+        finally:
+            self._list.blockSignals(was_blocked)
+            self._list.setUpdatesEnabled(True)
+            self._block_item_changed = False
 
     # ----- helpers -----------------------------------------------------------
     def _is_adder_item(self, item: QtWidgets.QListWidgetItem, /) -> bool:
         return item is not None and item.data(QtCore.Qt.UserRole) == "__adder__"
 
     # ----- context menu / add point -----------------------------------------
+    @QtCore.Slot(QtCore.QPoint)
     def _on_context_menu(self, pos):
         if self.layer is None:
             return
@@ -258,16 +428,33 @@ class LayerItem(QtWidgets.QWidget):
     def _notify(self, text: str):
         QtWidgets.QToolTip.showText(QtGui.QCursor.pos(), text, self)
 
+    def _point_at_cached(self, color: QtGui.QColor, /):
+        """
+        gradient.point_at for this row's gradient, memoized per packed rgb.
+        Validation and application of the same edit hit point_at twice with
+        the same color; the memo is reset whenever the layer's gradient
+        object is swapped.
+        """
+        grad = self._overlay[self._layer_idx].gradient
+        if grad is not self._point_at_grad:
+            self._point_at_cache.clear()
+            self._point_at_grad = grad
+        key = (color.red() << 16) | (color.green() << 8) | color.blue()
+        pt = self._point_at_cache.get(key, _MISS)
+        if pt is _MISS:
+            pt = grad.point_at(Color.from_qcolor(color))
+            self._point_at_cache[key] = pt
+        return pt
+
     # --- helper: validate color is available in current gradient ----------------
     def _color_supported(self, color: QtGui.QColor) -> bool:
-        return self._overlay[self._layer_idx].gradient.point_at(Color.from_qcolor(color)) is not None
+        return self._point_at_cached(color) is not None
 
     def _apply_color_edit_row(self, idx: int, color: QtGui.QColor):
         if not (isinstance(color, QtGui.QColor) and color.isValid()):
             return
         # validate against gradient
-        grad = self._overlay[self._layer_idx].gradient
-        pt = grad.point_at(Color.from_qcolor(color))
+        pt = self._point_at_cached(color)
         if pt is None:
             self._notify("Color not available in this gradient")
             return
@@ -288,13 +475,14 @@ class LayerItem(QtWidgets.QWidget):
         except RuntimeError:
             pass
 
+    @QtCore.Slot(QtWidgets.QListWidgetItem)
     def _on_item_double_clicked(self, item: QtWidgets.QListWidgetItem):
         if self.layer is None:
             return
         if self._is_adder_item(item):
             self._add_point_via_color()
             return
-        idx = self._list.row(item)
+        idx = item.data(_ROW_ROLE)
         start = item.data(QtCore.Qt.UserRole)
         initial = start if isinstance(start, QtGui.QColor) else QtGui.QColor(255, 255, 255)
         color = QtWidgets.QColorDialog.getColor(initial, self, "Choose color")
@@ -302,50 +490,65 @@ class LayerItem(QtWidgets.QWidget):
             return
         self._apply_color_edit_row(idx, color)
 
+    @QtCore.Slot(QtWidgets.QListWidgetItem)
     def _on_item_changed(self, item: QtWidgets.QListWidgetItem):
         if self._block_item_changed or self.layer is None or self._is_adder_item(item):
             return
-        idx = self._list.row(item)
-        txt = item.text()
-        parts = [p.strip() for p in txt.split(":")[-1].split(",")]
-        if len(parts) != 3:
+        idx = item.data(_ROW_ROLE)
+        m = _RGB_RE.search(item.text())
+        if m is None:
             self._revert_item(idx, item)
             return
-        try:
-            r, g, b = (max(0, min(255, int(v))) for v in parts)
-        except Exception:
-            self._revert_item(idx, item)
-            return
-        color = QtGui.QColor(r, g, b)
+        r, g, b = (min(255, int(v)) for v in m.groups())
+        # packed-int ctor skips PySide6's per-argument overload resolution
+        color = QtGui.QColor.fromRgb((r << 16) | (g << 8) | b)
         if not color.isValid() or not self._color_supported(color):
             self._notify("Color not available in this gradient")
             self._revert_item(idx, item)
             return
-        # re-fetch item to avoid stale pointer
-        fresh = self._list.item(idx)
-        if fresh is None or self._is_adder_item(fresh):
-            return
-        try:
-            self._apply_color_edit(idx, fresh, color)
-        except RuntimeError:
-            # list rebuilt meanwhile; nothing to do
-            pass
+        # validation stays immediate (cheap via the point_at memo); the
+        # apply is coalesced so a burst of edits on one row costs a single
+        # rewrite of the last value
+        self._pending_edits[idx] = color
+        self._edit_timer.start(50)
+
+    @QtCore.Slot()
+    def _flush_pending_edits(self, /):
+        pending, self._pending_edits = self._pending_edits, {}
+        for idx, color in pending.items():
+            # re-fetch item to avoid stale pointer
+            fresh = self._list.item(idx)
+            if fresh is None or self._is_adder_item(fresh):
+                continue
+            try:
+                self._apply_color_edit(idx, fresh, color)
+            except RuntimeError:
+                # list rebuilt meanwhile; nothing to do
+                pass
 
     def _apply_color_edit(self, idx: int, item: QtWidgets.QListWidgetItem, color: QtGui.QColor, /):
+        c = Color.from_qcolor(color)
+        text = _format_rgb_text(idx, c)
         self._block_item_changed = True
         item.setData(QtCore.Qt.UserRole, color)
-        item.setText(self._format_rgb_text(idx, Color.from_qcolor(color)))
-        self._apply_item_brushes(item, Color.from_qcolor(color))
+        item.setText(text)
         self._block_item_changed = False
+        # mirror the rewrite into the refresh diff's cache; otherwise the
+        # next refresh compares against stale text and skips this row
+        if 0 <= idx < len(self._last_rows):
+            self._last_rows[idx] = (text, self._row_key(c))
 
     def _revert_item(self, idx: int, item: QtWidgets.QListWidgetItem, /):
         if self._is_adder_item(item):
             return
         prev = item.data(QtCore.Qt.UserRole)
         self._block_item_changed = True
-        item.setText(self._format_rgb_text(idx, prev if isinstance(prev, QtGui.QColor) else None))
-        self._apply_item_brushes(item, prev if isinstance(prev, QtGui.QColor) else None)
+        item.setText(_format_rgb_text(idx, prev if isinstance(prev, QtGui.QColor) else None))
         self._block_item_changed = False
+        # the on-screen text no longer matches what the last refresh wrote;
+        # drop the cached row so the next refresh rewrites it from the model
+        if 0 <= idx < len(self._last_rows):
+            self._last_rows[idx] = ("", None)
 
     def setName(self, name: str):
         """Set the row title without emitting nameEdited (avoids feedback loops)."""
@@ -370,11 +573,12 @@ class LayerItem(QtWidgets.QWidget):
             name = self._overlay[idx].name or "Overlay"
             self.setName(name)
 
+    @QtCore.Slot()
     def _activate_self(self):
         self._overlay.set_active_layer(self._layer_idx)
         self.requestActivate.emit(self)
 
-    def _apply_registry_gradient(self, grad_cls):
+    def _apply_registry_gradient(self, grad_cls, checked: bool = False):
         """
         Instantiate the selected gradient class using its own defaults,
         and apply it to the active layer.
@@ -383,16 +587,14 @@ class LayerItem(QtWidgets.QWidget):
         layer_widget.set_gradient(grad_cls())
         self.requestActivate.emit(self)
 
-    def _apply_point_editor(self, key: str):
+    def _apply_point_editor(self, key: str, checked: bool = False):
         """
         Switch the active layer's point editor to the given registry key.
         Converts the current path to the new editor (best-effort fit), updates UI,
         and emits overlayUpdated so dependents refresh.
         """
-        # Resolve editor class
-        editor_cls = point_editor_registry[key]
-        # Build editor instance
-        new_editor: PointEditorComponent = editor_cls()
+        # Resolve the shared editor instance for that key
+        new_editor: PointEditorComponent = get_point_editor(key)
 
         self.layer.path.set_point_editor(new_editor)
         self._overlay.update()
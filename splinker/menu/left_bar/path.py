@@ -43,16 +43,26 @@ class PathTab(QtWidgets.QWidget):
         self.layerSelected.connect(self._refresh_editor_from_active)
         self._overlay.layerNameChanged.connect(self._on_layer_name_changed)
 
+        # coalesce refresh bursts (e.g. pointsChanged per mouse-move) to at
+        # most one rebuild per ~frame
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._do_refresh_all)
+
 
         self._rebuild_from_manager()
 
+    @QtCore.Slot()
     def _rebuild_from_manager(self):
         if self._overlay is None:
+            self._detach_rows()
             self._list.clear()
             self._clear_editor()
             return
 
         # Build rows using small overlay-like shims exposing `.spline`
+        self._detach_rows()
         self._list.clear()
         for i in range(len(self._overlay)):
             name = self._overlay[i].name
@@ -72,6 +82,15 @@ class PathTab(QtWidgets.QWidget):
         # sync editor with current
         self._refresh_editor_from_active()
 
+    def _detach_rows(self):
+        # clear() deletes the row widgets without close events, so unhook
+        # them from the overlay signals first (see LayerItem.detach)
+        for i in range(self._list.count()):
+            w = self._list.itemWidget(self._list.item(i))
+            if isinstance(w, LayerItem):
+                w.detach()
+
+    @QtCore.Slot(int)
     def _refresh_row(self, idx: int):
         if 0 <= idx < self._list.count():
             item = self._list.item(idx)
@@ -79,6 +98,7 @@ class PathTab(QtWidgets.QWidget):
             if isinstance(w, LayerItem):
                 w.refresh()
 
+    @QtCore.Slot(int)
     def _select_active_row(self, idx: int):
         if 0 <= idx < self._list.count():
             self._list.setCurrentRow(idx)
@@ -95,6 +115,7 @@ class PathTab(QtWidgets.QWidget):
         return row_widget
 
     def set_overlays(self, overlays: list, names: list[str] | None = None):
+        self._detach_rows()
         self._list.clear()
         for i, ov in enumerate(overlays):
             nm = names[i] if (names and i < len(names)) else f"Overlay {i+1}"
@@ -108,12 +129,19 @@ class PathTab(QtWidgets.QWidget):
         return w.overlay if isinstance(w, LayerItem) else None
 
     def refresh_all(self):
+        # restarting an already-pending timer is a no-op, so signal bursts
+        # collapse into a single _do_refresh_all call
+        self._refresh_timer.start()
+
+    @QtCore.Slot()
+    def _do_refresh_all(self):
         for i in range(self._list.count()):
             w = self._list.itemWidget(self._list.item(i))
             if isinstance(w, LayerItem):
 
                 w.refresh()
 
+    @QtCore.Slot(int)
     def _on_row_changed(self, row: int):
         if row < 0:
             self.layerSelected.emit(None)
@@ -123,11 +151,13 @@ class PathTab(QtWidgets.QWidget):
         if isinstance(w, LayerItem):
             self.layerSelected.emit(w)
 
+    @QtCore.Slot(object)
     def _emit_activate(self, layer: LayerItem):
         assert isinstance(layer, LayerItem)
         self.layerSelected.emit(layer)
 
 
+    @QtCore.Slot(int)
     def _on_layer_name_changed(self, idx: int):
         if 0 <= idx < self._list.count():
             item = self._list.item(idx)
@@ -152,6 +182,7 @@ class PathTab(QtWidgets.QWidget):
         ph.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         self._editor_lay.addWidget(ph)
 
+    @QtCore.Slot()
     def _refresh_editor_from_active(self, *args):
         """
         Swap in the proper editor for the active layer's gradient,
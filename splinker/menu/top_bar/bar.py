@@ -1,7 +1,6 @@
 from PySide6 import QtCore, QtWidgets
 
 from splinker.widgets import CanvasWidget
-from splinker.menu.top_bar.tools import ToolSelectorWidget
 from splinker.menu.top_bar.layer_selector import LayerSwitchWidget
 
 
@@ -17,8 +16,6 @@ class Bar(QtWidgets.QToolBar):
         self.setIconSize(QtCore.QSize(18, 18))
         self.overlay_selector = LayerSwitchWidget(self.overlay)
 
-        # Add your existing widget into the toolbar
-        # self.addWidget(ToolSelectorWidget())
         self.addWidget(self.reset_button)
         self.addWidget(self.overlay_selector)
 
@@ -35,6 +35,7 @@ class ToolSelectorWidget(QtWidgets.QWidget):
         return self.select_box.currentData().value
 
 
+    @QtCore.Slot(str)
     def _on_mode_changed(self, text: str):
         mode = ToolMode(text)
         self.mode_changed.emit(mode)
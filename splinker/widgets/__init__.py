@@ -2,6 +2,7 @@ from typing import Type
 
 from .editors import EditorFactory, HsvWheelEditor, HsvSquareEditor
 from .canvas import CanvasWidget
+from .sampler import LayerSampler
 from splinker.core.gradients import Gradient, HsvWheelGradient, HsvSquareGradient
 from splinker.widgets.layer_display import PaletteDisplayComponent
 
@@ -12,5 +13,6 @@ editor_registry: dict[Type[Gradient], EditorFactory] = {
 __all__ = [
     "CanvasWidget",
     "editor_registry",
+    "LayerSampler",
     "PaletteDisplayComponent"
 ]
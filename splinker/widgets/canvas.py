@@ -94,15 +94,13 @@ class CanvasWidget(QtWidgets.QWidget):
     def count(self) -> int:
         return len(self._palette)
 
+    def layer_index_for_name(self, name: str) -> int:
+        return self._palette.layer_index_for_name(name)
 
     def duplicate_layer(self, index: int | str) -> int:
         if isinstance(index, str):
             # map name to index
-            found = -1
-            for i in range(len(self._palette)):
-                if self._palette[i].name == index:
-                    found = i
-                    break
+            found = self._palette.layer_index_for_name(index)
             if found == -1:
                 raise KeyError(index)
             index = found
@@ -123,6 +121,7 @@ class CanvasWidget(QtWidgets.QWidget):
         return len(self._palette)
 
     # --- internals --------------------------
+    @QtCore.Slot()
     def _emit_overlay_updated_for_active(self):
         idx = self._palette.active_idx
         if idx != -1:
@@ -146,6 +145,7 @@ class CanvasWidget(QtWidgets.QWidget):
         idx = self._palette.active_idx
         self.overlayUpdated.emit(idx)
 
+    @QtCore.Slot(str)
     def on_tab_changed(self, name):
         match name:
             case "Path":
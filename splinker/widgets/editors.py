@@ -32,6 +32,7 @@ class IGradientEditor(QtWidgets.QWidget):
         self._leading_lock = bool(enabled)
 
     # --- internal emit helpers ----------------------------------------------
+    @QtCore.Slot()
     def _emit_now(self) -> None:
         g = self.gradient()
         if g is not None:
@@ -0,0 +1,66 @@
+import numpy as np
+
+from PySide6 import QtCore
+
+from splinker.core import Layer, Path
+
+
+class _SampleRunnable(QtCore.QRunnable):
+    """Computes one sampling pass on the global thread pool."""
+
+    def __init__(self, sampler: "LayerSampler", generation: int, path: Path, gradient, n: int):
+        super().__init__()
+        self._sampler = sampler
+        self._generation = generation
+        self._path = path  # private snapshot, not shared with the GUI
+        self._gradient = gradient  # immutable after construction
+        self._n = n
+
+    def run(self):
+        samples = self._path.interpolate(n=self._n)
+        if not samples or len(samples) < 2:
+            self._sampler._resultReady.emit(self._generation, None, None, None)
+            return
+        hsva, valid = self._gradient.color_at_batch(np.asarray(samples, dtype=np.float64))
+        ts = np.linspace(0.0, 1.0, len(samples))
+        self._sampler._resultReady.emit(self._generation, ts, hsva, valid)
+
+
+class LayerSampler(QtCore.QObject):
+    """
+    Runs the Layer.sample pipeline (interpolate + batch coloring) off the
+    GUI thread via QThreadPool. Each request() snapshots the layer's path,
+    so the worker never touches live, mutable state; gradients are
+    immutable and can be shared as-is.
+
+    Results arrive on the GUI thread through stopsReady(ts, hsva, valid):
+    ts is an (N,) float array of stop positions in [0, 1], hsva an (N, 4)
+    int array, valid an (N,) bool mask. Requests superseded before their
+    worker finishes are dropped (generation counter), so only the latest
+    sampling ever reaches the UI.
+    """
+
+    stopsReady = QtCore.Signal(object, object, object)  # (ts, hsva, valid)
+    # worker -> GUI thread hop; auto connection queues across threads
+    _resultReady = QtCore.Signal(int, object, object, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._generation = 0
+        self._resultReady.connect(self._on_result)
+
+    def request(self, layer: Layer, n: int = 64):
+        """Schedule a sampling pass for `layer`; coalesces stale ones."""
+        self._generation += 1
+        snapshot = Path.from_dict(layer.path.to_dict())
+        QtCore.QThreadPool.globalInstance().start(
+            _SampleRunnable(self, self._generation, snapshot, layer.gradient, n)
+        )
+
+    @QtCore.Slot(int, object, object, object)
+    def _on_result(self, generation: int, ts, hsva, valid):
+        if generation != self._generation:
+            return  # a newer request is in flight; drop this one
+        if ts is None:
+            return
+        self.stopsReady.emit(ts, hsva, valid)